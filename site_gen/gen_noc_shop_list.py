@@ -2,12 +2,81 @@
 """ Auto-generate a list of NOC Shop items for Sphinx to include."""
 
 import os
+import re
+import posixpath
 import glob
+import json
+import hashlib
+import shutil
+import collections
 import yaml
 import subprocess
+import functools
+import threading
+import concurrent.futures
 import mako.template
 
+try:
+    # Prefer the libyaml-backed loader, it is much faster than the pure-Python one
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
+# Paths used by the generator, relative to this script
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SOURCES_DIR = os.path.join(_HERE, 'sources')
+_DEFAULT_CLONE_DIR = os.path.join(_HERE, '..', 'build', 'cloned_repos')
+_OUT_DIR = os.path.join(_HERE, '..', 'source', 'autogen')
+_OOT_TMPL = os.path.join(_HERE, 'oot-page.md.mako')
+_INDEX_TMPL = os.path.join(_HERE, 'index.md.mako')
+_RENDER_CACHE_PATH = os.path.join(_HERE, '..', 'build', '.render_cache.json')
+
+# Prefixes stripped from URLs for display, and from git URLs before cloning
+_URL_STRIP_RE = re.compile(r'^(?:git\+)?(?:https?://)?')
+_GIT_PREFIX_RE = re.compile(r'^git\+')
+
+# Config for every git invocation: use the cheaper v2 wire protocol, and
+# don't let fetches kick off a garbage collection
+_GIT_CONFIG = ['-c', 'protocol.version=2', '-c', 'gc.auto=0']
+
+# Entries found in the RFNoC directory of a repository
+Block = collections.namedtuple('Block', 'name file config')
+Module = collections.namedtuple('Module', 'name file config')
+Adapter = collections.namedtuple('Adapter', 'name file config')
+
+# Subdirectories of the RFNoC directory that are scanned, the repo_info key
+# their entries are stored under, what they are called in messages, and the
+# type of their entries
+_RFNOC_SECTIONS = (
+    ('blocks', 'rfnoc_blocks', 'block', Block),
+    ('modules', 'rfnoc_modules', 'module', Module),
+    ('transport_adapters', 'rfnoc_transport_adapters', 'transport adapter', Adapter),
+)
+
+# Top-level keys of manifest.yml that the page templates use
+_MANIFEST_KEYS = ('title', 'brief', 'authors', 'license', 'hdl_license', 'url', 'source')
+
+# Top-level keys of block/module/adapter YAML files that oot-page.md.mako uses
+_RFNOC_CONFIG_KEYS = ('name', 'description', 'license', 'hdl_license')
+
+# Upper limit of git clones that run at the same time
+MAX_CLONE_WORKERS = 32
+
+# Fewer repositories than this are scanned in-process: starting a process pool
+# costs far more than scanning a handful of repositories
+MIN_PARALLEL_SCAN_REPOS = 8
+
+# Serializes output from worker threads so lines don't get interleaved
+_print_lock = threading.Lock()
+
+
+def _print(*args, **kwargs):
+    """Thread-safe print()."""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_url(url_str):
     """Sanitize a URL for display in a Markdown file.
 
@@ -16,15 +85,201 @@ def sanitize_url(url_str):
     - Remove any http://, https:// prefix
     - Remove a git+ prefix
     """
-    url_str = url_str.replace('http://', '').replace('https://', '').replace('git+', '')
-    return url_str
+    return _URL_STRIP_RE.sub('', url_str, count=1)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(template_path):
+    """Load and compile a Mako template, only once per path."""
+    return mako.template.Template(filename=template_path)
 
 
 def render_template_to_file(data, template_path, out_path):
-    """Render a Mako template to a file."""
-    template = mako.template.Template(filename=template_path)
-    with open(out_path, 'w') as f:
-        f.write(template.render(**data, sanitize_url=sanitize_url))
+    """Render a Mako template to a file.
+
+    If the file already has the rendered content, it is left untouched so that
+    its mtime doesn't change and Sphinx doesn't rebuild the page. Otherwise,
+    it is replaced atomically.
+
+    Returns:
+        bool: True if the file was written, False if it was up to date
+    """
+    template = _get_template(template_path)
+    data_bytes = template.render(**data, sanitize_url=sanitize_url).encode('utf-8')
+    try:
+        with open(out_path, 'rb') as f:
+            if f.read() == data_bytes:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data_bytes)
+    os.replace(tmp_path, out_path)
+    return True
+
+
+def _parse_yml(yml_file):
+    """Parse a YAML file.
+
+    The file is handed to the parser in binary mode, which skips the text
+    decoding step. Empty files are not parsed at all.
+
+    Returns:
+        The parsed content, or None if the file is empty
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if os.path.getsize(yml_file) == 0:
+        return None
+    with open(yml_file, 'rb') as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def _parse_top_keys(yml_file, keys):
+    """Parse only some top-level keys of a YAML file.
+
+    Walks the parser events instead of building the whole document, and stops
+    as soon as all keys have been found. Values of other keys are skipped
+    without being constructed. If a requested value is anything other than a
+    plain scalar (or the document isn't a mapping), the file is fully parsed
+    instead.
+
+    Returns:
+        dict: The requested keys that are present in the file, or None if the
+              file is empty
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if os.path.getsize(yml_file) == 0:
+        return None
+    wanted = set(keys)
+    result = {}
+    with open(yml_file, 'rb') as f:
+        depth = 0
+        key = None
+        for event in yaml.parse(f, Loader=_Loader):
+            if depth == 0:
+                if isinstance(event, yaml.MappingStartEvent):
+                    depth = 1
+                elif isinstance(event, yaml.StreamEndEvent):
+                    return None
+                elif not isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+                    break
+            elif depth == 1:
+                if isinstance(event, yaml.MappingEndEvent):
+                    return result
+                if key is None:
+                    # Complex and merge keys need the full parser
+                    if not isinstance(event, yaml.ScalarEvent) or event.value == '<<':
+                        break
+                    key = event.value
+                    continue
+                if key in wanted:
+                    if not isinstance(event, yaml.ScalarEvent):
+                        break
+                    result[key] = _construct_scalar(event)
+                    if len(result) == len(wanted):
+                        return result
+                elif isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    depth += 1
+                key = None
+            elif isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+    # Fall back to parsing everything
+    data = _parse_yml(yml_file)
+    if isinstance(data, dict):
+        return {k: data[k] for k in keys if k in data}
+    return data
+
+
+def _load_top_level(yml_file, keys):
+    """Load only some top-level keys of a YAML file.
+
+    The document is composed into nodes as usual, but only the values of the
+    requested keys are turned into Python objects. Unlike _parse_top_keys(),
+    these values may be collections.
+
+    Returns:
+        dict: The requested keys that are present in the file, or None if the
+              file is empty. Documents that aren't mappings are returned as-is.
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if os.path.getsize(yml_file) == 0:
+        return None
+    with open(yml_file, 'rb') as f:
+        loader = _Loader(f)
+        try:
+            node = loader.get_single_node()
+            if node is None:
+                return None
+            if not isinstance(node, yaml.MappingNode):
+                return loader.construct_document(node)
+            # Resolve merge keys ('<<') first
+            loader.flatten_mapping(node)
+            result = {}
+            for key_node, value_node in node.value:
+                if not isinstance(key_node, yaml.ScalarNode):
+                    continue
+                key = loader.construct_object(key_node)
+                if key in keys:
+                    result[key] = loader.construct_object(value_node, deep=True)
+            return result
+        finally:
+            loader.dispose()
+
+
+def _construct_scalar(event):
+    """Turn a scalar parser event into the same value yaml.safe_load() would."""
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = yaml.resolver.Resolver().resolve(yaml.ScalarNode, event.value, event.implicit)
+    node = yaml.ScalarNode(tag, event.value, style=event.style)
+    return yaml.constructor.SafeConstructor().construct_object(node)
+
+
+def _iter_yml(yml_dir):
+    """Iterate over the .yml files in a directory.
+
+    Like glob.glob(os.path.join(yml_dir, '*.yml')), but uses a single
+    os.scandir() pass and doesn't need to stat each entry separately.
+    A missing directory yields nothing.
+
+    Yields:
+        tuple: (file name, file path) for each .yml file
+    """
+    try:
+        with os.scandir(yml_dir) as it:
+            for entry in it:
+                # glob skips hidden files, so do we
+                if (entry.name.endswith('.yml') and not entry.name.startswith('.')
+                        and entry.is_file()):
+                    yield entry.name, entry.path
+    except FileNotFoundError:
+        return
+
+
+def _list_dir(path):
+    """List a directory with a single os.scandir() call.
+
+    The returned DirEntry objects cache their type, so checking them doesn't
+    cost another stat() like os.path.exists() would.
+
+    Returns:
+        dict: Entry names as keys and os.DirEntry objects as values, or None
+              if the directory doesn't exist
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def read_source_files():
@@ -33,8 +288,7 @@ def read_source_files():
     Returns:
         dict: Dictionary with filename (without .yml) as key and YAML content as value
     """
-    sources_dir = os.path.join(os.path.dirname(__file__), 'sources')
-    yml_files = glob.glob(os.path.join(sources_dir, '*.yml'))
+    yml_files = glob.glob(os.path.join(_SOURCES_DIR, '*.yml'))
     
     result = {}
     for yml_file in yml_files:
@@ -42,19 +296,182 @@ def read_source_files():
         filename = os.path.splitext(os.path.basename(yml_file))[0]
         
         # Read and parse YAML content
-        with open(yml_file, 'r') as f:
-            try:
-                content = yaml.safe_load(f)
-                result[filename] = content
-            except yaml.YAMLError as e:
-                print(f"Error parsing {yml_file}: {e}")
-                result[filename] = None
+        try:
+            result[filename] = _parse_yml(yml_file)
+        except yaml.YAMLError as e:
+            print(f"Error parsing {yml_file}: {e}")
+            result[filename] = None
     
     return result
 
 
+def _run_git(args, env):
+    """Run a git command with the common config options.
+
+    Raises:
+        subprocess.CalledProcessError: If the git command fails
+    """
+    return subprocess.run(
+        ['git'] + _GIT_CONFIG + args,
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env
+    )
+
+
+def _sparse_paths(rfnoc_path):
+    """Return the paths to pass to 'git sparse-checkout set' for a repository.
+
+    Besides the top-level files (manifest.yml etc.), we only need the RFNoC
+    directory that scan_cloned_repositories() looks at. If that directory is
+    the repository root, there is nothing to leave out.
+
+    Returns:
+        list: The sparse checkout cone, or None if the whole repository needs
+              to be checked out
+    """
+    # Git wants forward slashes and no leading slash, regardless of the OS
+    rfnoc_path = posixpath.normpath(rfnoc_path.strip('/') or '.')
+    if rfnoc_path == '.':
+        return None
+    return [rfnoc_path]
+
+
+def _update_clone(repo_dir, git_url, branch, sparse_paths, env):
+    """Update an existing shallow clone in-place to the tip of the given branch.
+
+    The URL of 'origin' is updated first so that a changed source URL is picked
+    up as well. This matters for partial clones: git downloads missing blobs
+    from 'origin' whenever the checkout needs them. If branch is None, the
+    remote HEAD is used.
+    The sparse checkout is reapplied (or disabled, if sparse_paths is None) in
+    case the configured paths changed.
+
+    Raises:
+        subprocess.CalledProcessError: If any of the git commands fail
+    """
+    if sparse_paths is None:
+        sparse_args = ['-C', repo_dir, 'sparse-checkout', 'disable']
+    else:
+        sparse_args = ['-C', repo_dir, 'sparse-checkout', 'set', '--'] + sparse_paths
+    for args in (
+        ['-C', repo_dir, 'remote', 'set-url', 'origin', git_url],
+        ['-C', repo_dir, 'fetch', '--depth', '1', '--no-tags', 'origin', branch or 'HEAD'],
+        ['-C', repo_dir, 'reset', '--hard', 'FETCH_HEAD'],
+        sparse_args,
+    ):
+        _run_git(args, env)
+
+
+def _clone_one(repo_name, config, clone_dir, env):
+    """Clone a single repository. Runs in a worker thread of clone_repositories().
+
+    Returns:
+        tuple: (repo_name, result dict as stored by clone_repositories())
+    """
+    if config is None:
+        return repo_name, {'status': 'error', 'message': 'Invalid YAML config'}
+
+    if 'source' not in config:
+        return repo_name, {'status': 'error', 'message': 'No source URL found'}
+
+    if not isinstance(config['source'], str):
+        return repo_name, {'status': 'error', 'message': 'Invalid source URL'}
+
+    # Extract git URL (handle git+ prefix if present)
+    git_url = _GIT_PREFIX_RE.sub('', config['source'], count=1)
+
+    # Get branch if specified in config
+    branch = config.get('gitbranch')
+
+    # Target directory for this repo
+    repo_dir = os.path.join(clone_dir, repo_name)
+
+    try:
+        rfnoc_path = config.get('rfnoc_path', 'rfnoc')
+        if not isinstance(rfnoc_path, str):
+            _print(f"Invalid rfnoc_path for {repo_name}: {rfnoc_path!r}")
+            return repo_name, {
+                'status': 'error',
+                'message': f"Invalid rfnoc_path: {rfnoc_path!r}",
+                'url': git_url
+            }
+        sparse_paths = _sparse_paths(rfnoc_path)
+
+        # If we already have a clone, only fetch what changed since last time
+        if os.path.isdir(os.path.join(repo_dir, '.git')):
+            try:
+                _update_clone(repo_dir, git_url, branch, sparse_paths, env)
+                _print(f"Successfully updated {repo_name} in {repo_dir}")
+                return repo_name, {
+                    'status': 'success',
+                    'path': repo_dir,
+                    'branch': branch or 'default',
+                    'url': git_url
+                }
+            except subprocess.CalledProcessError as e:
+                _print(f"Failed to update {repo_name}, cloning from scratch: {e.stderr}")
+
+        # Remove existing directory if it exists
+        if os.path.exists(repo_dir):
+            shutil.rmtree(repo_dir)
+
+        # Perform shallow, partial clone. Blobs are only downloaded for the
+        # files that are actually checked out.
+        cmd = [
+            'clone',
+            '--depth', '1',  # Shallow clone
+            '--single-branch',
+            '--no-tags',
+            '--filter=blob:none',
+        ]
+
+        # Start out with only the top-level files if we don't need everything
+        if sparse_paths is not None:
+            cmd.append('--sparse')
+
+        # Only add branch option if specified in YAML
+        if branch:
+            cmd.extend(['--branch', branch])
+
+        cmd.extend([git_url, repo_dir])
+
+        _run_git(cmd, env)
+
+        # Check out the RFNoC directory on top of the top-level files
+        if sparse_paths is not None:
+            _run_git(['-C', repo_dir, 'sparse-checkout', 'set', '--'] + sparse_paths, env)
+
+        _print(f"Successfully cloned {repo_name} to {repo_dir}")
+        return repo_name, {
+            'status': 'success',
+            'path': repo_dir,
+            'branch': branch or 'default',
+            'url': git_url
+        }
+
+    except subprocess.CalledProcessError as e:
+        _print(f"Failed to clone {repo_name}: {e.stderr}")
+        return repo_name, {
+            'status': 'error',
+            'message': f"Git clone failed: {e.stderr}",
+            'url': git_url
+        }
+    except Exception as e:
+        _print(f"Unexpected error cloning {repo_name}: {str(e)}")
+        return repo_name, {
+            'status': 'error',
+            'message': f"Unexpected error: {str(e)}",
+            'url': git_url
+        }
+
+
 def clone_repositories(source_dict, clone_dir=None):
     """Clone repositories using shallow clones based on source dictionary.
+
+    The clones are run in parallel, since they spend most of their time
+    waiting on the network.
     
     Args:
         source_dict (dict): Dictionary from read_source_files() with repo configurations
@@ -65,82 +482,97 @@ def clone_repositories(source_dict, clone_dir=None):
         dict: Dictionary with repo names as keys and clone status/path as values
     """
     if clone_dir is None:
-        clone_dir = os.path.join(os.path.dirname(__file__), '..', 'build', 'cloned_repos')
+        clone_dir = _DEFAULT_CLONE_DIR
     
     # Create clone directory if it doesn't exist
     os.makedirs(clone_dir, exist_ok=True)
     
-    results = {}
+    if not source_dict:
+        return {}
+
+    # Never wait for credentials: nobody could answer the prompt from a
+    # worker thread
+    env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+    max_workers = min(MAX_CLONE_WORKERS, len(source_dict))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(executor.map(
+            lambda item: _clone_one(item[0], item[1], clone_dir, env),
+            source_dict.items()
+        ))
     
-    for repo_name, config in source_dict.items():
-        if config is None:
-            results[repo_name] = {'status': 'error', 'message': 'Invalid YAML config'}
-            continue
-            
-        if 'source' not in config:
-            results[repo_name] = {'status': 'error', 'message': 'No source URL found'}
-            continue
-        
-        # Extract git URL (handle git+ prefix if present)
-        git_url = config['source']
-        if git_url.startswith('git+'):
-            git_url = git_url[4:]  # Remove 'git+' prefix
+    return results
+
+
+def _scan_one(repo_name, repo_path, source_info):
+    """Scan a single cloned repository for RFNoC blocks.
+
+    Runs in a worker process of scan_cloned_repositories(), so all arguments
+    and the return value must be picklable.
+
+    Args:
+        repo_name (str): Name of the repository
+        repo_path (str): Path to the cloned repository
+        source_info (dict): Source configuration for this repository
+
+    Returns:
+        tuple: (repo_name, dict with the discovered information)
+    """
+    repo_info = {
+        'path': repo_path,
+        'manifest': None,
+        'rfnoc_blocks': [],
+        'rfnoc_modules': [],
+        'rfnoc_transport_adapters': [],
+        'has_rfnoc': False
+    }
+    
+    try:
+        # Start with source file values as defaults
+        merged_manifest = source_info.copy()
         
-        # Get branch if specified in config
-        branch = config.get('gitbranch')
+        # One directory listing tells us which top-level files exist
+        top_entries = _list_dir(repo_path) or {}
+
+        # Check for manifest.yml and merge with source defaults
+        manifest_entry = top_entries.get('manifest.yml')
+        if manifest_entry is not None and manifest_entry.is_file():
+            manifest_data = _load_top_level(manifest_entry.path, _MANIFEST_KEYS) or {}
+            # Manifest values override source values
+            merged_manifest.update(manifest_data)
         
-        # Target directory for this repo
-        repo_dir = os.path.join(clone_dir, repo_name)
+        repo_info['manifest'] = merged_manifest
         
-        try:
-            # Remove existing directory if it exists
-            if os.path.exists(repo_dir):
-                import shutil
-                shutil.rmtree(repo_dir)
-            
-            # Perform shallow clone
-            cmd = [
-                'git', 'clone', 
-                '--depth', '1',  # Shallow clone
-            ]
-            
-            # Only add branch option if specified in YAML
-            if branch:
-                cmd.extend(['--branch', branch])
-            
-            cmd.extend([git_url, repo_dir])
-            
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
+        # Check for RFNoC structure
+        # Use rfnoc_path from source config if provided, otherwise default to 'rfnoc'
+        rfnoc_subpath = source_info.get('rfnoc_path', 'rfnoc')
+        # The path is relative to the repository, even with a leading slash
+        rfnoc_dir = os.path.join(repo_path, rfnoc_subpath.lstrip('/'))
+        rfnoc_entries = _list_dir(rfnoc_dir)
+        if rfnoc_entries is not None:
+            repo_info['has_rfnoc'] = True
             
-            results[repo_name] = {
-                'status': 'success', 
-                'path': repo_dir,
-                'branch': branch or 'default',
-                'url': git_url
-            }
-            print(f"Successfully cloned {repo_name} to {repo_dir}")
-            
-        except subprocess.CalledProcessError as e:
-            results[repo_name] = {
-                'status': 'error', 
-                'message': f"Git clone failed: {e.stderr}",
-                'url': git_url
-            }
-            print(f"Failed to clone {repo_name}: {e.stderr}")
-        except Exception as e:
-            results[repo_name] = {
-                'status': 'error', 
-                'message': f"Unexpected error: {str(e)}",
-                'url': git_url
-            }
-            print(f"Unexpected error cloning {repo_name}: {str(e)}")
+            # Look for RFNoC blocks, modules and transport adapters
+            for subdir, key, kind, entry_type in _RFNOC_SECTIONS:
+                section_dir = rfnoc_entries.get(subdir)
+                if section_dir is None or not section_dir.is_dir():
+                    continue
+                for yml_name, yml_file in _iter_yml(section_dir.path):
+                    try:
+                        config = _parse_top_keys(yml_file, _RFNOC_CONFIG_KEYS)
+                    except yaml.YAMLError as e:
+                        print(f"Error parsing RFNoC {kind} {yml_file}: {e}")
+                        continue
+                    if config is None:
+                        continue
+                    repo_info[key].append(
+                        entry_type(name=yml_name[:-4], file=yml_file, config=config))
     
-    return results
+    except Exception as e:
+        repo_info['error'] = f"Error scanning repository: {str(e)}"
+        print(f"Error scanning {repo_name}: {str(e)}")
+    
+    return repo_name, repo_info
 
 
 def scan_cloned_repositories(clone_dir=None, sources=None):
@@ -154,119 +586,89 @@ def scan_cloned_repositories(clone_dir=None, sources=None):
         dict: Dictionary with repo names as keys and discovered information as values
     """
     if clone_dir is None:
-        clone_dir = os.path.join(os.path.dirname(__file__), '..', 'build', 'cloned_repos')
-    
-    if not os.path.exists(clone_dir):
-        return {}
+        clone_dir = _DEFAULT_CLONE_DIR
     
     scan_results = {}
     
-    # Get all subdirectories (each should be a cloned repo)
-    repo_dirs = [d for d in os.listdir(clone_dir) 
-                 if os.path.isdir(os.path.join(clone_dir, d))]
-    
-    for repo_name in repo_dirs:
-        repo_path = os.path.join(clone_dir, repo_name)
-        repo_info = {
-            'path': repo_path,
-            'manifest': None,
-            'readme': None,
-            'rfnoc_blocks': [],
-            'rfnoc_modules': [],
-            'rfnoc_transport_adapters': [],
-            'has_rfnoc': False
-        }
-        
-        try:
-            # Start with source file values as defaults
-            source_info = sources.get(repo_name, {}) if sources else {}
-            merged_manifest = source_info.copy()
-            
-            # Check for manifest.yml and merge with source defaults
-            manifest_path = os.path.join(repo_path, 'manifest.yml')
-            if os.path.exists(manifest_path):
-                with open(manifest_path, 'r') as f:
-                    manifest_data = yaml.safe_load(f) or {}
-                    # Manifest values override source values
-                    merged_manifest.update(manifest_data)
-            
-            repo_info['manifest'] = merged_manifest
-            
-            # Check for README.md
-            readme_path = os.path.join(repo_path, 'README.md')
-            if os.path.exists(readme_path):
-                with open(readme_path, 'r') as f:
-                    # Read first 100 lines for summary
-                    lines = f.readlines()[:100]
-                    repo_info['readme'] = ''.join(lines).strip()
-            
-            # Check for RFNoC structure
-            # Use rfnoc_path from source config if provided, otherwise default to 'rfnoc'
-            rfnoc_subpath = source_info.get('rfnoc_path', 'rfnoc')
-            rfnoc_dir = os.path.join(repo_path, rfnoc_subpath)
-            if os.path.exists(rfnoc_dir):
-                repo_info['has_rfnoc'] = True
-                
-                # Look for RFNoC blocks
-                blocks_dir = os.path.join(rfnoc_dir, 'blocks')
-                if os.path.exists(blocks_dir):
-                    yml_files = glob.glob(os.path.join(blocks_dir, '*.yml'))
-                    for yml_file in yml_files:
-                        block_name = os.path.splitext(os.path.basename(yml_file))[0]
-                        try:
-                            with open(yml_file, 'r') as f:
-                                block_info = yaml.safe_load(f)
-                                repo_info['rfnoc_blocks'].append({
-                                    'name': block_name,
-                                    'file': yml_file,
-                                    'config': block_info
-                                })
-                        except yaml.YAMLError as e:
-                            print(f"Error parsing RFNoC block {yml_file}: {e}")
-                
-                # Look for RFNoC modules
-                modules_dir = os.path.join(rfnoc_dir, 'modules')
-                if os.path.exists(modules_dir):
-                    yml_files = glob.glob(os.path.join(modules_dir, '*.yml'))
-                    for yml_file in yml_files:
-                        module_name = os.path.splitext(os.path.basename(yml_file))[0]
-                        try:
-                            with open(yml_file, 'r') as f:
-                                module_info = yaml.safe_load(f)
-                                repo_info['rfnoc_modules'].append({
-                                    'name': module_name,
-                                    'file': yml_file,
-                                    'config': module_info
-                                })
-                        except yaml.YAMLError as e:
-                            print(f"Error parsing RFNoC module {yml_file}: {e}")
-                
-                # Look for RFNoC transport adapters
-                transport_dir = os.path.join(rfnoc_dir, 'transport_adapters')
-                if os.path.exists(transport_dir):
-                    yml_files = glob.glob(os.path.join(transport_dir, '*.yml'))
-                    for yml_file in yml_files:
-                        adapter_name = os.path.splitext(os.path.basename(yml_file))[0]
-                        try:
-                            with open(yml_file, 'r') as f:
-                                adapter_info = yaml.safe_load(f)
-                                repo_info['rfnoc_transport_adapters'].append({
-                                    'name': adapter_name,
-                                    'file': yml_file,
-                                    'config': adapter_info
-                                })
-                        except yaml.YAMLError as e:
-                            print(f"Error parsing RFNoC transport adapter {yml_file}: {e}")
-        
-        except Exception as e:
-            repo_info['error'] = f"Error scanning repository: {str(e)}"
-            print(f"Error scanning {repo_name}: {str(e)}")
-        
-        scan_results[repo_name] = repo_info
+    # Get all subdirectories (each should be a cloned repo). DirEntry already
+    # knows its type and full path, so no extra stat() or join is needed.
+    try:
+        with os.scandir(clone_dir) as it:
+            repo_entries = [(entry.name, entry.path) for entry in it if entry.is_dir()]
+    except FileNotFoundError:
+        return scan_results
+
+    if not repo_entries:
+        return scan_results
+
+    repo_dirs, repo_paths = zip(*repo_entries)
+    source_infos = [sources.get(repo_name, {}) if sources else {}
+                    for repo_name in repo_dirs]
+    max_workers = min(len(repo_dirs), os.cpu_count() or 1)
+
+    if len(repo_dirs) < MIN_PARALLEL_SCAN_REPOS or max_workers == 1:
+        results = map(_scan_one, repo_dirs, repo_paths, source_infos)
+        scan_results.update(results)
+        return scan_results
+
+    # The repositories are independent of each other, so scan them in parallel.
+    # One repository per task: their sizes vary a lot (UHD has many more
+    # blocks than most), so bigger chunks would leave workers idle.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        scan_results.update(executor.map(
+            _scan_one, repo_dirs, repo_paths, source_infos))
     
     return scan_results
 
 
+def _json_safe(obj):
+    """Make obj serializable by json.dumps(..., sort_keys=True).
+
+    YAML allows keys of any type, which JSON can't sort when they are mixed
+    (e.g. 1 and 'title'), so mapping keys are replaced by their repr().
+    """
+    if isinstance(obj, dict):
+        return {repr(key): _json_safe(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(value) for value in obj]
+    return obj
+
+
+def _repo_info_key(repo_info):
+    """Return a hash of everything that goes into a repository's page."""
+    data = json.dumps(_json_safe(repo_info), sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(data).hexdigest()
+
+
+def _file_key(path):
+    """Return a hash of a file's content."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read()).hexdigest()
+
+
+def _load_render_cache():
+    """Load the render cache written by the previous generate_shop_list() run.
+
+    Returns:
+        dict: Repo names as keys and [repo info hash, template mtime,
+              generator hash] as values. Empty if there is no (valid) cache
+              file.
+    """
+    try:
+        with open(_RENDER_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_render_cache(cache):
+    """Write the render cache for the next generate_shop_list() run."""
+    os.makedirs(os.path.dirname(_RENDER_CACHE_PATH), exist_ok=True)
+    with open(_RENDER_CACHE_PATH, 'w') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+
+
 def generate_shop_list():
     """ Generate a list of NOC Shop items for Sphinx to include."""
     print("Starting NOC Shop list generation...")
@@ -288,42 +690,60 @@ def generate_shop_list():
     scan_results = scan_cloned_repositories(sources=sources)
     
     # Generate output directory
-    out_dir = os.path.join(os.path.dirname(__file__), '..', 'source', 'autogen')
-    os.makedirs(out_dir, exist_ok=True)
+    os.makedirs(_OUT_DIR, exist_ok=True)
     
     # Generate one file per repository
     generated_files = []
-    oot_template_path = os.path.join(os.path.dirname(__file__), 'oot-page.md.mako')
+
+    # Pages whose inputs haven't changed since the last run are not rendered again
+    render_cache = _load_render_cache()
+    new_render_cache = {}
+    oot_template_mtime = os.path.getmtime(_OOT_TMPL)
+    # Changes to this script (e.g. to sanitize_url() or to the data passed to
+    # the template) also change the pages
+    generator_key = _file_key(os.path.abspath(__file__))
     
     for repo_name, repo_info in scan_results.items():
         # Create filename based on repo name
         filename = f"{repo_name}.md"
-        oot_page_path = os.path.join(out_dir, filename)
+        oot_page_path = os.path.join(_OUT_DIR, filename)
+        generated_files.append(filename)
+
+        cache_entry = [_repo_info_key(repo_info), oot_template_mtime, generator_key]
+        new_render_cache[repo_name] = cache_entry
+        if render_cache.get(repo_name) == cache_entry and os.path.exists(oot_page_path):
+            print(f"{filename} is up to date")
+            continue
         
         # Render template for this repository using the helper function
-        render_template_to_file(
+        written = render_template_to_file(
             data={
                 'repo': repo_info,
                 'repo_name': repo_name
             },
-            template_path=oot_template_path,
+            template_path=_OOT_TMPL,
             out_path=oot_page_path
         )
         
-        generated_files.append(filename)
-        print(f"Generated {filename}")
+        if written:
+            print(f"Generated {filename}")
+        else:
+            print(f"{filename} is unchanged")
+
+    _save_render_cache(new_render_cache)
     
     # Generate index file with list of all repositories
-    index_template_path = os.path.join(os.path.dirname(__file__), 'index.md.mako')
-    index_path = os.path.join(out_dir, '..', 'index.md')
+    index_path = os.path.join(_OUT_DIR, '..', 'index.md')
     
-    render_template_to_file(
+    written = render_template_to_file(
         data={'scan_results': scan_results},
-        template_path=index_template_path,
+        template_path=_INDEX_TMPL,
         out_path=index_path
     )
+    if not written:
+        print("index.md is unchanged")
 
-    print(f"Generated {len(generated_files)} repository pages and index at {out_dir}")
+    print(f"Generated {len(generated_files)} repository pages and index at {_OUT_DIR}")
     return scan_results
 
 
@@ -30,11 +30,11 @@ ${'##'} RFNoC Blocks
 
 % for block in repo['rfnoc_blocks']:
 <%
-  block_brief = block['config'].get('description')
+  block_brief = block.config.get('description')
 %>
-- **${block['config'].get('name', block['name'])}**${ ": " + block_brief if block_brief else "" }
-  - Software License: ${block['config'].get('license', license_info)}
-  - HDL License: ${block['config'].get('hdl_license', hdl_license_info)}
+- **${block.config.get('name', block.name)}**${ ": " + block_brief if block_brief else "" }
+  - Software License: ${block.config.get('license', license_info)}
+  - HDL License: ${block.config.get('hdl_license', hdl_license_info)}
 
 % endfor
 
@@ -44,11 +44,11 @@ ${'###'} RFNoC Modules
 
 % for block in repo['rfnoc_modules']:
 <%
-  block_brief = block['config'].get('description')
+  block_brief = block.config.get('description')
 %>
-- **${block['config'].get('name', block['name'])}**${ ": " + block_brief if block_brief else "" }
-  - Software License: ${block['config'].get('license', license_info)}
-  - HDL License: ${block['config'].get('hdl_license', hdl_license_info)}
+- **${block.config.get('name', block.name)}**${ ": " + block_brief if block_brief else "" }
+  - Software License: ${block.config.get('license', license_info)}
+  - HDL License: ${block.config.get('hdl_license', hdl_license_info)}
 % endfor
 
 % endif
@@ -57,11 +57,11 @@ ${'###'} RFNoC Transport Adapters
 
 % for block in repo['rfnoc_transport_adapters']:
 <%
-  block_brief = block['config'].get('description')
+  block_brief = block.config.get('description')
 %>
-- **${block['config'].get('name', block['name'])}**${ ": " + block_brief if block_brief else "" }
-  - Software License: ${block['config'].get('license', license_info)}
-  - HDL License: ${block['config'].get('hdl_license', hdl_license_info)}
+- **${block.config.get('name', block.name)}**${ ": " + block_brief if block_brief else "" }
+  - Software License: ${block.config.get('license', license_info)}
+  - HDL License: ${block.config.get('hdl_license', hdl_license_info)}
 % endfor
 
 % endif
\ No newline at end of file